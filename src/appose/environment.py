@@ -38,6 +38,31 @@ from typing import Dict, List, Optional, Sequence, Union
 from .paths import find_exe
 from .service import Service
 
+# Candidate executables and launch arguments are invariant across calls,
+# so they are built once here rather than on every service creation.
+
+_PYTHON_EXES = [
+    "python",
+    "python3",
+    "python.exe",
+    "bin/python",
+    "bin/python.exe",
+]
+
+_PYTHON_ARGS = [
+    "-c",
+    "import appose.python_worker; appose.python_worker.main()",
+]
+
+_JAVA_EXES = [
+    "java",
+    "java.exe",
+    "bin/java",
+    "bin/java.exe",
+    "jre/bin/java",
+    "jre/bin/java.exe",
+]
+
 
 class Environment:
     def __init__(self, base: Union[Path, str], use_system_path: bool = False):
@@ -56,18 +81,7 @@ class Environment:
         :see: groovy() To create a service for Groovy script execution.
         :raises IOError: If something goes wrong starting the worker process.
         """
-        python_exes = [
-            "python",
-            "python3",
-            "python.exe",
-            "bin/python",
-            "bin/python.exe",
-        ]
-        return self.service(
-            python_exes,
-            "-c",
-            "import appose.python_worker; appose.python_worker.main()",
-        )
+        return self.service(_PYTHON_EXES, *_PYTHON_ARGS)
 
     def groovy(
         self,
@@ -124,15 +138,7 @@ class Environment:
         args.append(main_class)
 
         # Create the service.
-        java_exes = [
-            "java",
-            "java.exe",
-            "bin/java",
-            "bin/java.exe",
-            "jre/bin/java",
-            "jre/bin/java.exe",
-        ]
-        return self.service(java_exes, *args)
+        return self.service(_JAVA_EXES, *args)
 
     def service(self, exes: Sequence[str], *args) -> Service:
         """
@@ -33,14 +33,31 @@ Utility functions for working with file paths.
 
 import os
 from pathlib import Path
-from typing import Optional, Sequence
+from typing import Dict, Optional, Sequence, Tuple
 
 
 def can_execute(exe: Path) -> bool:
     return os.access(exe, os.X_OK)
 
 
+# Successful executable searches, keyed by the candidate lists.
+_exe_cache: Dict[Tuple, Path] = {}
+
+
 def find_exe(dirs: Sequence[str], exes: Sequence[str]) -> Optional[Path]:
+    key = (tuple(dirs), tuple(exes))
+    exe_file = _exe_cache.get(key)
+    if exe_file is None:
+        exe_file = _find_exe(dirs, exes)
+        if exe_file is not None:
+            # NB: Only successful searches are cached, so that executables
+            # appearing later (e.g. in a newly built environment) are
+            # still discovered by subsequent searches.
+            _exe_cache[key] = exe_file
+    return exe_file
+
+
+def _find_exe(dirs: Sequence[str], exes: Sequence[str]) -> Optional[Path]:
     for exe in exes:
         exe_file = Path(exe)
         if exe_file.is_absolute():
@@ -41,14 +41,17 @@ https://github.com/apposed/appose/blob/-/README.md#workers
 import ast
 import sys
 import traceback
+from queue import Queue
 from threading import Thread
-from time import sleep
 from typing import Optional
 
 # NB: Avoid relative imports so that this script can be run standalone.
 from appose.service import RequestType, ResponseType
 from appose.types import Args, _set_worker, decode, encode
 
+# Tasks whose threads have terminated, awaiting cleanup by the janitor.
+_finished_tasks: Queue = Queue()
+
 
 class Task:
     def __init__(self, uuid: str) -> None:
@@ -87,51 +90,57 @@ class Task:
 
     def _start(self, script: str, inputs: Optional[Args]) -> None:
         def execute_script():
-            # Populate script bindings.
-            binding = {"task": self}
-            if inputs is not None:
-                binding.update(inputs)
-
-            # Inform the calling process that the script is launching.
-            self._report_launch()
-
-            # Execute the script.
-            # result = exec(script, locals=binding)
-            result = None
             try:
-                # NB: Execute the block, except for the last statement,
-                # which we evaluate instead to get its return value.
-                # Credit: https://stackoverflow.com/a/39381428/1207769
-
-                block = ast.parse(script, mode="exec")
-                last = None
-                if (
-                    len(block.body) > 0
-                    and hasattr(block.body[-1], "value")
-                    and not isinstance(block.body[-1], ast.Assign)
-                ):
-                    # Last statement of the script looks like an expression. Evaluate!
-                    last = ast.Expression(block.body.pop().value)
-
-                _globals = {}
-                exec(compile(block, "<string>", mode="exec"), _globals, binding)
-                if last is not None:
-                    result = eval(
-                        compile(last, "<string>", mode="eval"), _globals, binding
-                    )
-            except Exception:
-                self.fail(traceback.format_exc())
-                return
-
-            # Report the results to the Appose calling process.
-            if isinstance(result, dict):
-                # Script produced a dict; add all entries to the outputs.
-                self.outputs.update(result)
-            elif result is not None:
-                # Script produced a non-dict; add it alone to the outputs.
-                self.outputs["result"] = result
-
-            self._report_completion()
+                # Populate script bindings.
+                binding = {"task": self}
+                if inputs is not None:
+                    binding.update(inputs)
+
+                # Inform the calling process that the script is launching.
+                self._report_launch()
+
+                # Execute the script.
+                # result = exec(script, locals=binding)
+                result = None
+                try:
+                    # NB: Execute the block, except for the last statement,
+                    # which we evaluate instead to get its return value.
+                    # Credit: https://stackoverflow.com/a/39381428/1207769
+
+                    block = ast.parse(script, mode="exec")
+                    last = None
+                    if (
+                        len(block.body) > 0
+                        and hasattr(block.body[-1], "value")
+                        and not isinstance(block.body[-1], ast.Assign)
+                    ):
+                        # Last statement of the script looks like an
+                        # expression. Evaluate!
+                        last = ast.Expression(block.body.pop().value)
+
+                    _globals = {}
+                    exec(compile(block, "<string>", mode="exec"), _globals, binding)
+                    if last is not None:
+                        result = eval(
+                            compile(last, "<string>", mode="eval"), _globals, binding
+                        )
+                except Exception:
+                    self.fail(traceback.format_exc())
+                    return
+
+                # Report the results to the Appose calling process.
+                if isinstance(result, dict):
+                    # Script produced a dict; add all entries to the outputs.
+                    self.outputs.update(result)
+                elif result is not None:
+                    # Script produced a non-dict; add it alone to the outputs.
+                    self.outputs["result"] = result
+
+                self._report_completion()
+            finally:
+                # Wake up the janitor thread to clean up after this task,
+                # even if the script killed the thread (e.g. via sys.exit).
+                _finished_tasks.put(self)
 
         # Create a thread and save a reference to it, in case its script
         # ends up killing the thread. This happens e.g. if it calls sys.exit.
@@ -177,24 +186,22 @@ def main() -> None:
     _set_worker(True)
 
     tasks = {}
-    running = True
-
-    def cleanup_threads():
-        while running:
-            sleep(0.05)
-            dead = {
-                uuid: task
-                for uuid, task in tasks.items()
-                if not task.thread.is_alive()
-            }
-            for uuid, task in dead.items():
-                tasks.pop(uuid)
-                if not task.finished:
-                    # The task died before reporting a terminal status.
-                    # We report this situation as failure by thread death.
-                    task.fail("thread death")
-
-    Thread(target=cleanup_threads, name="Appose-Janitor").start()
+
+    def cleanup_tasks():
+        # Block until a task's thread terminates, rather than
+        # polling all known task threads on a fixed interval.
+        while True:
+            task = _finished_tasks.get()
+            if task is None:
+                # No more tasks are coming; stop the cleanup loop.
+                break
+            tasks.pop(task.uuid, None)
+            if not task.finished:
+                # The task died before reporting a terminal status.
+                # We report this situation as failure by thread death.
+                task.fail("thread death")
+
+    Thread(target=cleanup_tasks, name="Appose-Janitor").start()
 
     while True:
         try:
@@ -223,7 +230,8 @@ def main() -> None:
                     continue
                 task.cancel_requested = True
 
-    running = False
+    # Signal the janitor thread to shut down.
+    _finished_tasks.put(None)
 
 
 if __name__ == "__main__":
@@ -31,7 +31,10 @@
 The appose.service package contains classes for services and tasks.
 """
 
+import os
+import selectors
 import subprocess
+import sys
 import threading
 from enum import Enum
 from pathlib import Path
@@ -89,25 +92,36 @@ class Service:
             return
 
         prefix = f"Appose-Service-{self._service_id}"
+        # NB: Pipes are opened in binary mode; lines are decoded and encoded
+        # explicitly at the boundary, avoiding TextIOWrapper overhead on
+        # every line of worker communication.
         self._process = subprocess.Popen(
             self._args,
             stdin=subprocess.PIPE,
             stdout=subprocess.PIPE,
             cwd=self._cwd,
-            text=True,
         )
-        self._stdout_thread = threading.Thread(
-            target=self._stdout_loop, name=f"{prefix}-Stdout"
-        )
-        self._stderr_thread = threading.Thread(
-            target=self._stderr_loop, name=f"{prefix}-Stderr"
-        )
-        self._monitor_thread = threading.Thread(
-            target=self._monitor_loop, name=f"{prefix}-Monitor"
-        )
-        self._stdout_thread.start()
-        self._stderr_thread.start()
-        self._monitor_thread.start()
+        if sys.platform == "win32":
+            # select() cannot watch pipes on Windows;
+            # fall back to one reader thread per stream.
+            self._stdout_thread = threading.Thread(
+                target=self._stdout_loop, name=f"{prefix}-Stdout"
+            )
+            self._stdout_thread.start()
+            if self._process.stderr is not None:
+                # Only read stderr when it is actually piped from the worker.
+                self._stderr_thread = threading.Thread(
+                    target=self._stderr_loop, name=f"{prefix}-Stderr"
+                )
+                self._stderr_thread.start()
+            self._monitor_thread = threading.Thread(
+                target=self._monitor_loop, name=f"{prefix}-Monitor"
+            )
+            self._monitor_thread.start()
+        else:
+            # Register the worker's streams with the shared reader, which
+            # services the output of all live workers with a single thread.
+            _reader.watch(self)
 
     def task(self, script: str, inputs: Optional[Args] = None) -> "Task":
         """
@@ -132,6 +146,32 @@ class Service:
     def __exit__(self, exc_type, exc_value, exc_tb) -> None:
         self.close()
 
+    def _dispatch_response(self, line: str) -> None:
+        """
+        Process a line of the worker's stdout,
+        notifying the corresponding task of the response.
+        """
+        # noinspection PyBroadException
+        try:
+            response = decode(line)
+            if self._debug_callback is not None:
+                # Echo the line to the debug listener.
+                self._debug_service(line)
+            uuid = response.get("task")
+            if uuid is None:
+                self._debug_service("Invalid service message: {line}")
+                return
+            task = self._tasks.get(uuid)
+            if task is None:
+                self._debug_service(f"No such task: {uuid}")
+                return
+            # noinspection PyProtectedMember
+            task._handle(response)
+        except Exception:
+            # Something went wrong decoding the line of JSON.
+            # Skip it and keep going, but log it first.
+            self._debug_service(f"<INVALID> {line}")
+
     def _stdout_loop(self) -> None:
         """
         Input loop processing lines from the worker's stdout stream.
@@ -146,28 +186,11 @@ class Service:
                 self._debug_service(format_exc())
                 break
 
-            if not line:  # readline returns empty string upon EOF
+            if not line:  # readline returns empty bytes upon EOF
                 self._debug_service("<worker stdout closed>")
                 return
 
-            # noinspection PyBroadException
-            try:
-                response = decode(line)
-                self._debug_service(line)  # Echo the line to the debug listener.
-                uuid = response.get("task")
-                if uuid is None:
-                    self._debug_service("Invalid service message: {line}")
-                    continue
-                task = self._tasks.get(uuid)
-                if task is None:
-                    self._debug_service(f"No such task: {uuid}")
-                    continue
-                # noinspection PyProtectedMember
-                task._handle(response)
-            except Exception:
-                # Something went wrong decoding the line of JSON.
-                # Skip it and keep going, but log it first.
-                self._debug_service(f"<INVALID> {line}")
+            self._dispatch_response(line.decode("utf-8"))
 
     def _stderr_loop(self) -> None:
         """
@@ -178,10 +201,10 @@ class Service:
             while True:
                 stderr = self._process.stderr
                 line = None if stderr is None else stderr.readline()
-                if not line:  # readline returns empty string upon EOF
+                if not line:  # readline returns empty bytes upon EOF
                     self._debug_service("<worker stderr closed>")
                     return
-                self._debug_worker(line)
+                self._debug_worker(line.decode("utf-8"))
         except Exception:
             self._debug_service(format_exc())
 
@@ -222,6 +245,202 @@ class Service:
         self._debug_callback(f"[{prefix}-{self._service_id}] {message}")
 
 
+class _WorkerState:
+    """
+    Bookkeeping for one worker being watched by the shared reader:
+    how many of its output streams remain open, and the pidfd (if any)
+    via which its death is detected.
+    """
+
+    def __init__(self, service: Service) -> None:
+        self.service = service
+        self.open_streams = 0
+        self.pidfd: Optional[int] = None
+
+
+class _ReaderPool:
+    """
+    A single selector loop servicing the output streams of every live
+    worker, rather than one reader thread per service. The reader thread
+    is started on demand and retires itself once no workers remain.
+    """
+
+    def __init__(self) -> None:
+        self._selector: Optional[selectors.BaseSelector] = None
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._wakeup_r: int = -1
+        self._wakeup_w: int = -1
+
+    def watch(self, service: Service) -> None:
+        """
+        Register the given service's worker streams with the shared reader.
+        """
+        process = service._process
+        # For each stream: line handler and EOF message.
+        streams = [
+            (process.stdout, service._dispatch_response, "<worker stdout closed>"),
+        ]
+        if process.stderr is not None:
+            # Only read stderr when it is actually piped from the worker.
+            streams.append(
+                (process.stderr, service._debug_worker, "<worker stderr closed>")
+            )
+        state = _WorkerState(service)
+        with self._lock:
+            if self._selector is None:
+                self._selector = selectors.DefaultSelector()
+                # Self-pipe for waking the selector when new workers arrive.
+                self._wakeup_r, self._wakeup_w = os.pipe()
+                os.set_blocking(self._wakeup_r, False)
+                self._selector.register(self._wakeup_r, selectors.EVENT_READ, None)
+            for stream, handle_line, eof_message in streams:
+                # NB: Our end of the pipe is switched to non-blocking mode,
+                # so that a spurious readiness report can never stall the
+                # loop inside os.read; we only drain what is available.
+                os.set_blocking(stream.fileno(), False)
+                self._selector.register(
+                    stream,
+                    selectors.EVENT_READ,
+                    (state, bytearray(), handle_line, eof_message),
+                )
+                state.open_streams += 1
+            if hasattr(os, "pidfd_open"):
+                # Watch the worker process itself (Linux), so that its death
+                # is noticed promptly even if a child of the worker inherited
+                # the output pipes and holds them open.
+                try:
+                    state.pidfd = os.pidfd_open(process.pid)
+                    self._selector.register(
+                        state.pidfd, selectors.EVENT_READ, (state, None, None, None)
+                    )
+                except OSError:
+                    state.pidfd = None
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._loop, name="Appose-Reader")
+                self._thread.start()
+            else:
+                # Poke the selector so it picks up the new registrations.
+                os.write(self._wakeup_w, b"\0")
+
+    def _loop(self) -> None:
+        while True:
+            with self._lock:
+                if len(self._selector.get_map()) == 1:
+                    # Only the wakeup pipe remains; retire this thread.
+                    self._thread = None
+                    return
+            for key, _ in self._selector.select():
+                if key.data is None:
+                    # Wakeup ping: drain it and loop around to re-select.
+                    try:
+                        while os.read(self._wakeup_r, 4096):
+                            pass
+                    except BlockingIOError:
+                        pass
+                    continue
+                if key.fileobj not in self._selector.get_map():
+                    # Stream was retired earlier in this event batch.
+                    continue
+                state = key.data[0]
+                # noinspection PyBroadException
+                try:
+                    if key.data[1] is None:
+                        # The worker process has terminated.
+                        self._reap(state)
+                    elif self._read(key) == "eof":
+                        self._retire(key)
+                except Exception:
+                    # Something went wrong reading the streams. Panic!
+                    state.service._debug_service(format_exc())
+
+    def _read(self, key: selectors.SelectorKey) -> str:
+        """
+        Read a chunk from the given stream and dispatch any complete lines.
+        Returns "data", "eof", or "again" according to what the read found.
+        """
+        _, buffer, handle_line, _ = key.data
+        try:
+            data = os.read(key.fd, 65536)
+        except BlockingIOError:
+            # Spurious readiness; nothing to read right now.
+            return "again"
+        if not data:  # os.read returns empty bytes upon EOF
+            return "eof"
+        buffer.extend(data)
+        eol = buffer.rfind(b"\n")
+        if eol >= 0:
+            # Split all complete lines in one pass, keeping any
+            # trailing partial line buffered for the next read.
+            lines = bytes(buffer[: eol + 1]).splitlines(keepends=True)
+            del buffer[: eol + 1]
+            for line in lines:
+                handle_line(line.decode("utf-8"))
+        return "data"
+
+    def _retire(self, key: selectors.SelectorKey) -> None:
+        """
+        Stop watching the given stream, flushing any partial final line.
+        When it is the worker's last open stream, finish the worker, too.
+        """
+        state, buffer, handle_line, eof_message = key.data
+        with self._lock:
+            self._selector.unregister(key.fileobj)
+        if buffer:
+            # Flush any trailing line lacking a newline.
+            handle_line(buffer.decode("utf-8"))
+        state.service._debug_service(eof_message)
+        state.open_streams -= 1
+        if state.open_streams == 0:
+            self._finish(state)
+
+    def _reap(self, state: _WorkerState) -> None:
+        """
+        Handle the death of a worker process: drain whatever output remains
+        in its pipes, then stop watching its streams, even if an orphaned
+        child of the worker still holds the write ends open.
+        """
+        with self._lock:
+            self._selector.unregister(state.pidfd)
+            keys = [
+                key
+                for key in self._selector.get_map().values()
+                if key.data is not None and key.data[0] is state
+            ]
+        os.close(state.pidfd)
+        state.pidfd = None
+        for key in keys:
+            while self._read(key) == "data":
+                pass
+            # Whether EOF or a pipe held open by an orphaned child:
+            # no further data is coming, so retire the stream.
+            self._retire(key)
+
+    def _finish(self, state: _WorkerState) -> None:
+        """
+        Reap the worker process and notify its pending tasks.
+        """
+        service = state.service
+        if state.pidfd is not None:
+            with self._lock:
+                self._selector.unregister(state.pidfd)
+            os.close(state.pidfd)
+            state.pidfd = None
+        if service._process.poll() is None:
+            # The worker closed its streams but has not terminated yet;
+            # await it on a separate thread rather than stalling the I/O
+            # of every other worker.
+            threading.Thread(
+                target=service._monitor_loop,
+                name=f"Appose-Service-{service._service_id}-Monitor",
+            ).start()
+        else:
+            service._monitor_loop()
+
+
+_reader = _ReaderPool()
+
+
 class TaskStatus(Enum):
     INITIAL = "INITIAL"
     QUEUED = "QUEUED"
@@ -290,9 +509,9 @@ class Task:
         self.uuid = uuid4().hex
         self.service = service
         self.script = script
-        self.inputs: Args = {}
-        if inputs is not None:
-            self.inputs.update(inputs)
+        # NB: Copy the inputs in one shot, rather than
+        # growing an initially empty dict incrementally.
+        self.inputs: Args = dict(inputs) if inputs else {}
         self.outputs: Args = {}
         self.status: TaskStatus = TaskStatus.INITIAL
         self.message: Optional[str] = None
@@ -350,8 +569,10 @@ class Task:
             request.update(args)
 
         encoded = encode(request)
+        stdin = self.service._process.stdin
+        stdin.write(encoded.encode("utf-8") + b"\n")
         # NB: Flush is necessary to ensure worker receives the data!
-        print(encoded, file=self.service._process.stdin, flush=True)
+        stdin.flush()
         self.service._debug_service(encoded)
 
     def _handle(self, response: Args) -> None:
@@ -90,11 +90,15 @@ class SharedMemory(shared_memory.SharedMemory):
 
 
 def encode(data: Args) -> str:
-    return json.dumps(data, cls=_ApposeJSONEncoder, separators=(",", ":"))
+    # NB: Reuse a single encoder instance, rather than letting json.dumps
+    # construct a new one for every message sent over the wire.
+    return _encoder.encode(data)
 
 
 def decode(the_json: str) -> Args:
-    return json.loads(the_json, object_hook=_appose_object_hook)
+    # NB: Reuse a single decoder instance, rather than letting json.loads
+    # construct a new one for every message received over the wire.
+    return _decoder.decode(the_json)
 
 
 class NDArray:
@@ -170,20 +174,31 @@ class _ApposeJSONEncoder(json.JSONEncoder):
         return super().default(obj)
 
 
+_encoder = _ApposeJSONEncoder(separators=(",", ":"))
+
+
 def _appose_object_hook(obj: Dict):
     atype = obj.get("appose_type")
+    if atype is None:
+        # Fast path: the vast majority of decoded objects are plain dicts.
+        return obj
     if atype == "shm":
         # Attach to existing shared memory block.
         return SharedMemory(name=(obj["name"]), size=(obj["size"]))
-    elif atype == "ndarray":
+    if atype == "ndarray":
         return NDArray(obj["dtype"], obj["shape"], obj["shm"])
-    else:
-        return obj
+    return obj
+
+
+_decoder = json.JSONDecoder(object_hook=_appose_object_hook)
+
+
+_NON_DIGITS = re.compile("[^0-9]")
 
 
 def _bytes_per_element(dtype: str) -> Union[int, float]:
     try:
-        bits = int(re.sub("[^0-9]", "", dtype))
+        bits = int(_NON_DIGITS.sub("", dtype))
     except ValueError:
         raise ValueError(f"Invalid dtype: {dtype}")
     return bits / 8
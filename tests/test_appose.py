@@ -27,6 +27,11 @@
 # #L%
 ###
 
+from collections import namedtuple
+from pathlib import Path
+
+import pytest
+
 import appose
 from appose.service import ResponseType, Service, TaskStatus
 
@@ -56,18 +61,39 @@ task.outputs["result"] = time
 """
 
 
-def test_groovy():
-    env = appose.system()
+def _collatz_updates():
+    """
+    Compute the expected (step, message) pairs for the collatz scripts.
+    """
+    updates = []
+    v = 9999
+    for i in range(91):
+        v = v // 2 if v % 2 == 0 else 3 * v + 1
+        updates.append((i, f"[{i}] -> {v}"))
+    return updates
+
+
+# NB: Computed once here, rather than redone for every test.
+expected_updates = [
+    (ResponseType.UPDATE, TaskStatus.RUNNING, message, i, 1, None)
+    for i, message in _collatz_updates()
+]
+
+
+@pytest.mark.slow
+@pytest.mark.skipif(
+    not Path("target/dependency").is_dir(),
+    reason="Groovy worker JARs not staged; run bin/test.sh first.",
+)
+def test_groovy(env):
     # NB: For now, use bin/test.sh to copy the needed JARs.
     class_path = ["target/dependency/*"]
     with env.groovy(class_path=class_path) as service:
         execute_and_assert(service, collatz_groovy)
 
 
-def test_python():
-    env = appose.system()
-    with env.python() as service:
-        execute_and_assert(service, collatz_python)
+def test_python(python_service):
+    execute_and_assert(python_service, collatz_python)
 
 
 def test_service_startup_failure():
@@ -83,22 +109,32 @@ def test_service_startup_failure():
         ) == str(e)
 
 
+# The state of a task at the moment an event occurred.
+# NB: A namedtuple, so that recording each event costs one tuple
+# allocation and event lists compare directly against expected tuples.
+TaskState = namedtuple(
+    "TaskState",
+    ["response_type", "status", "message", "current", "maximum", "error"],
+)
+
+
 def execute_and_assert(service: Service, script: str):
     task = service.task(script)
 
     # Record the state of the task for each event that occurs.
-
-    class TaskState:
-        def __init__(self, event):
-            self.response_type = event.response_type
-            self.status = event.task.status
-            self.message = event.task.message
-            self.current = event.task.current
-            self.maximum = event.task.maximum
-            self.error = event.task.error
-
     events = []
-    task.listen(lambda event: events.append(TaskState(event)))
+    task.listen(
+        lambda event: events.append(
+            TaskState(
+                event.response_type,
+                event.task.status,
+                event.task.message,
+                event.task.current,
+                event.task.maximum,
+                event.task.error,
+            )
+        )
+    )
 
     # Wait for task to finish.
     task.wait_for()
@@ -120,16 +156,9 @@ def execute_and_assert(service: Service, script: str):
     assert 1 == launch.maximum
     assert launch.error is None
 
-    v = 9999
-    for i in range(91):
-        v = v // 2 if v % 2 == 0 else 3 * v + 1
-        update = events[i + 1]
-        assert ResponseType.UPDATE == update.response_type
-        assert TaskStatus.RUNNING == update.status
-        assert f"[{i}] -> {v}" == update.message
-        assert i == update.current
-        assert 1 == update.maximum
-        assert update.error is None
+    # Compare all update events against the expected states in one shot.
+    # NB: namedtuples compare equal to plain tuples, field for field.
+    assert expected_updates == events[1:92]
 
     completion = events[92]
     assert ResponseType.COMPLETION == completion.response_type
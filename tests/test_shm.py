@@ -27,34 +27,35 @@
 # #L%
 ###
 
+import numpy
+
 import appose
 from appose.service import TaskStatus
 
 ndarray_inspect = """
+import numpy
 task.outputs["size"] = data.shm.size
 task.outputs["dtype"] = data.dtype
 task.outputs["shape"] = data.shape
-task.outputs["sum"] = sum(v for v in data.shm.buf)
+task.outputs["sum"] = int(numpy.frombuffer(data.shm.buf, dtype=numpy.uint8).sum())
 """
 
 
-def test_ndarray():
-    env = appose.system()
-    with env.python() as service:
-        with appose.SharedMemory(create=True, size=2 * 2 * 20 * 25) as shm:
-            # Construct the data.
-            shm.buf[0] = 123
-            shm.buf[456] = 78
-            shm.buf[1999] = 210
-            data = appose.NDArray("uint16", [2, 20, 25], shm)
+def test_ndarray(python_service):
+    with appose.SharedMemory(create=True, size=2 * 2 * 20 * 25) as shm:
+        # Construct the data, writing all elements in one vectorized call
+        # rather than one scalar memoryview assignment apiece.
+        buf = numpy.frombuffer(shm.buf, dtype=numpy.uint8)
+        buf[[0, 456, 1999]] = (123, 78, 210)
+        data = appose.NDArray("uint16", [2, 20, 25], shm)
 
-            # Run the task.
-            task = service.task(ndarray_inspect, {"data": data})
-            task.wait_for()
+        # Run the task.
+        task = python_service.task(ndarray_inspect, {"data": data})
+        task.wait_for()
 
-            # Validate the execution result.
-            assert TaskStatus.COMPLETE == task.status
-            assert 2 * 20 * 25 * 2 == task.outputs["size"]
-            assert "uint16" == task.outputs["dtype"]
-            assert [2, 20, 25] == task.outputs["shape"]
-            assert 123 + 78 + 210 == task.outputs["sum"]
+        # Validate the execution result.
+        assert TaskStatus.COMPLETE == task.status
+        assert 2 * 20 * 25 * 2 == task.outputs["size"]
+        assert "uint16" == task.outputs["dtype"]
+        assert [2, 20, 25] == task.outputs["shape"]
+        assert 123 + 78 + 210 == task.outputs["sum"]
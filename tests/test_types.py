@@ -27,105 +27,111 @@
 # #L%
 ###
 
-import unittest
+import pytest
 
 import appose
 
+JSON = (
+    "{"
+    '"posByte":123,"negByte":-98,'
+    '"posDouble":9.876543210123456,"negDouble":-1.234567890987654e+302,'
+    '"posFloat":9.876543,"negFloat":-1.2345678,'
+    '"posInt":1234567890,"negInt":-987654321,'
+    '"posLong":12345678987654321,"negLong":-98765432123456789,'
+    '"posShort":32109,"negShort":-23456,'
+    '"trueBoolean":true,"falseBoolean":false,'
+    '"nullChar":"\\u0000",'
+    '"aString":"-=[]\\\\;\',./_+{}|:\\"<>?'
+    "AaBbCcDdEeFfGgHhIiJjKkLlMmNnOoPpQqRrSsTtUuVvWwXxYyZz"
+    '~!@#$%^&*()",'
+    '"numbers":[1,1,2,3,5,8],'
+    '"words":["quick","brown","fox"],'
+    # fmt: off
+    '"ndArray":{'
+        '"appose_type":"ndarray",'  # noqa: E131
+        '"dtype":"float32",'        # noqa: E131
+        '"shape":[2,20,25],'        # noqa: E131
+        '"shm":{'                   # noqa: E131
+            '"appose_type":"shm",'  # noqa: E131
+            '"name":"SHM_NAME",'    # noqa: E131
+            '"size":4000'           # noqa: E131
+        "}"                         # noqa: E131
+    "}"
+    # fmt: on
+    "}"
+)
 
-class TypesTest(unittest.TestCase):
-    JSON = (
-        "{"
-        '"posByte":123,"negByte":-98,'
-        '"posDouble":9.876543210123456,"negDouble":-1.234567890987654e+302,'
-        '"posFloat":9.876543,"negFloat":-1.2345678,'
-        '"posInt":1234567890,"negInt":-987654321,'
-        '"posLong":12345678987654321,"negLong":-98765432123456789,'
-        '"posShort":32109,"negShort":-23456,'
-        '"trueBoolean":true,"falseBoolean":false,'
-        '"nullChar":"\\u0000",'
-        '"aString":"-=[]\\\\;\',./_+{}|:\\"<>?'
-        "AaBbCcDdEeFfGgHhIiJjKkLlMmNnOoPpQqRrSsTtUuVvWwXxYyZz"
-        '~!@#$%^&*()",'
-        '"numbers":[1,1,2,3,5,8],'
-        '"words":["quick","brown","fox"],'
-        # fmt: off
-        '"ndArray":{'
-            '"appose_type":"ndarray",'  # noqa: E131
-            '"dtype":"float32",'        # noqa: E131
-            '"shape":[2,20,25],'        # noqa: E131
-            '"shm":{'                   # noqa: E131
-                '"appose_type":"shm",'  # noqa: E131
-                '"name":"SHM_NAME",'    # noqa: E131
-                '"size":4000'           # noqa: E131
-            "}"                         # noqa: E131
-        "}"
-        # fmt: on
-        "}"
-    )
+STRING = (
+    "-=[]\\;',./_+{}|:\"<>?"
+    "AaBbCcDdEeFfGgHhIiJjKkLlMmNnOoPpQqRrSsTtUuVvWwXxYyZz"
+    "~!@#$%^&*()"
+)
 
-    STRING = (
-        "-=[]\\;',./_+{}|:\"<>?"
-        "AaBbCcDdEeFfGgHhIiJjKkLlMmNnOoPpQqRrSsTtUuVvWwXxYyZz"
-        "~!@#$%^&*()"
-    )
+NUMBERS = [1, 1, 2, 3, 5, 8]
 
-    NUMBERS = [1, 1, 2, 3, 5, 8]
+WORDS = ["quick", "brown", "fox"]
 
-    WORDS = ["quick", "brown", "fox"]
 
-    def test_encode(self):
-        data = {
-            "posByte": 123,
-            "negByte": -98,
-            "posDouble": 9.876543210123456,
-            "negDouble": -1.234567890987654e302,
-            "posFloat": 9.876543,
-            "negFloat": -1.2345678,
-            "posInt": 1234567890,
-            "negInt": -987654321,
-            "posLong": 12345678987654321,
-            "negLong": -98765432123456789,
-            "posShort": 32109,
-            "negShort": -23456,
-            "trueBoolean": True,
-            "falseBoolean": False,
-            "nullChar": "\0",
-            "aString": self.STRING,
-            "numbers": self.NUMBERS,
-            "words": self.WORDS,
-        }
-        with appose.NDArray("float32", [2, 20, 25]) as ndarray:
-            shm_name = ndarray.shm.name
-            data["ndArray"] = ndarray
-            json_str = appose.types.encode(data)
-            self.assertIsNotNone(json_str)
-            expected = self.JSON.replace("SHM_NAME", shm_name)
-            self.assertEqual(expected, json_str)
+@pytest.fixture(scope="module")
+def shm():
+    """
+    A single 4000-byte shared memory block, reused by this module's tests
+    rather than allocated and unlinked per test.
+    """
+    with appose.SharedMemory(create=True, size=4000) as block:
+        yield block
 
-    def test_decode(self):
-        with appose.SharedMemory(create=True, size=4000) as shm:
-            shm_name = shm.name
-            data = appose.types.decode(self.JSON.replace("SHM_NAME", shm_name))
-            self.assertIsNotNone(data)
-            self.assertEqual(19, len(data))
-            self.assertEqual(123, data["posByte"])
-            self.assertEqual(-98, data["negByte"])
-            self.assertEqual(9.876543210123456, data["posDouble"])
-            self.assertEqual(-1.234567890987654e302, data["negDouble"])
-            self.assertEqual(9.876543, data["posFloat"])
-            self.assertEqual(-1.2345678, data["negFloat"])
-            self.assertEqual(1234567890, data["posInt"])
-            self.assertEqual(-987654321, data["negInt"])
-            self.assertEqual(12345678987654321, data["posLong"])
-            self.assertEqual(-98765432123456789, data["negLong"])
-            self.assertEqual(32109, data["posShort"])
-            self.assertEqual(-23456, data["negShort"])
-            self.assertTrue(data["trueBoolean"])
-            self.assertFalse(data["falseBoolean"])
-            self.assertEqual("\0", data["nullChar"])
-            self.assertEqual(self.STRING, data["aString"])
-            self.assertEqual(self.NUMBERS, data["numbers"])
-            self.assertEqual(self.WORDS, data["words"])
-            ndArray = data["ndArray"]
-            self.assertEqual("float32", ndArray.dtype)
-            self.assertEqual([2, 20, 25], ndArray.shape)
+
+def test_encode(shm):
+    data = {
+        "posByte": 123,
+        "negByte": -98,
+        "posDouble": 9.876543210123456,
+        "negDouble": -1.234567890987654e302,
+        "posFloat": 9.876543,
+        "negFloat": -1.2345678,
+        "posInt": 1234567890,
+        "negInt": -987654321,
+        "posLong": 12345678987654321,
+        "negLong": -98765432123456789,
+        "posShort": 32109,
+        "negShort": -23456,
+        "trueBoolean": True,
+        "falseBoolean": False,
+        "nullChar": "\0",
+        "aString": STRING,
+        "numbers": NUMBERS,
+        "words": WORDS,
+        "ndArray": appose.NDArray("float32", [2, 20, 25], shm),
+    }
+    json_str = appose.types.encode(data)
+    assert json_str is not None
+    expected = JSON.replace("SHM_NAME", shm.name)
+    assert expected == json_str
+
+
+def test_decode(shm):
+    data = appose.types.decode(JSON.replace("SHM_NAME", shm.name))
+    assert data is not None
+    assert 19 == len(data)
+    assert 123 == data["posByte"]
+    assert -98 == data["negByte"]
+    assert 9.876543210123456 == data["posDouble"]
+    assert -1.234567890987654e302 == data["negDouble"]
+    assert 9.876543 == data["posFloat"]
+    assert -1.2345678 == data["negFloat"]
+    assert 1234567890 == data["posInt"]
+    assert -987654321 == data["negInt"]
+    assert 12345678987654321 == data["posLong"]
+    assert -98765432123456789 == data["negLong"]
+    assert 32109 == data["posShort"]
+    assert -23456 == data["negShort"]
+    assert data["trueBoolean"]
+    assert not data["falseBoolean"]
+    assert "\0" == data["nullChar"]
+    assert STRING == data["aString"]
+    assert NUMBERS == data["numbers"]
+    assert WORDS == data["words"]
+    nd_array = data["ndArray"]
+    assert "float32" == nd_array.dtype
+    assert [2, 20, 25] == nd_array.shape